@@ -21,6 +21,14 @@ with open(_CONFIG_PATH) as _f:
 # Default model, overridable by env.
 DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", _config["default_model"])
 
+# Opt-in: extract all resume sections with one LLM call instead of one call per
+# section. pdf.py falls back to per-section extraction if the combined call fails.
+SINGLE_CALL_EXTRACTION = os.getenv("SINGLE_CALL_EXTRACTION", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 # Flat model -> {temperature, top_p} map. Preserves the contract that
 # prompt.MODEL_PARAMETERS exposed to evaluator.py / pdf.py / github.py / score.py.
 MODEL_PARAMETERS = {
@@ -33,7 +41,7 @@ MODEL_PARAMETERS = {
 def provider_for(model_name: str) -> dict:
     """Resolve provider config for a model.
 
-    Returns {base_url, api_key, structured_output, extra_body}.
+    Returns {base_url, api_key, structured_output, extra_body, max_concurrency}.
     Raises ValueError if the model is unknown or its required key is unset.
     """
     for name, prov in _config["providers"].items():
@@ -46,6 +54,12 @@ def provider_for(model_name: str) -> dict:
                 f"Model '{model_name}' uses provider '{name}', which requires "
                 f"env var '{api_key_env}', but it is unset."
             )
+        max_concurrency = prov.get("max_concurrency", 4)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError(
+                f"Provider '{name}' has max_concurrency={max_concurrency!r}; "
+                f"it must be an integer of at least 1."
+            )
         extra_body = {
             **prov.get("extra_body", {}),
             **prov["models"][model_name].get("extra_body", {}),
@@ -55,6 +69,7 @@ def provider_for(model_name: str) -> dict:
             "api_key": api_key,
             "structured_output": prov.get("structured_output", "json_schema"),
             "extra_body": extra_body,
+            "max_concurrency": max_concurrency,
         }
 
     available = ", ".join(sorted(MODEL_PARAMETERS))
@@ -1,10 +1,6 @@
-from typing import Dict, List, Optional, Tuple, Any
-from pydantic import BaseModel, Field, field_validator
-from models import JSONResume, EvaluationData
+from models import EvaluationData
 from llm_utils import initialize_llm_provider, extract_json_from_response
 import logging
-import json
-import re
 
 MAX_BONUS_POINTS = 20
 MIN_FINAL_SCORE = -20
@@ -14,10 +10,12 @@ from prompt import (
     DEFAULT_MODEL,
     MODEL_PARAMETERS,
 )
-from prompts.template_manager import TemplateManager
+from prompts.template_manager import get_template_manager
 
 logger = logging.getLogger(__name__)
 
+_EVALUATION_SCHEMA = EvaluationData.model_json_schema()
+
 
 class ResumeEvaluator:
     def __init__(self, model_name: str = DEFAULT_MODEL, model_params: dict = None):
@@ -28,7 +26,7 @@ class ResumeEvaluator:
         self.model_params = model_params or MODEL_PARAMETERS.get(
             model_name, {"temperature": 0.5, "top_p": 0.9}
         )
-        self.template_manager = TemplateManager()
+        self.template_manager = get_template_manager()
         self._initialize_llm_provider()
 
     def _initialize_llm_provider(self):
@@ -71,7 +69,7 @@ class ResumeEvaluator:
             }
 
             # Add format parameter for structured output
-            kwargs = {"format": EvaluationData.model_json_schema()}
+            kwargs = {"format": _EVALUATION_SCHEMA}
             # Use the appropriate provider to make the API call
             response = self.provider.chat(**chat_params, **kwargs)
 
@@ -79,8 +77,8 @@ class ResumeEvaluator:
             response_text = extract_json_from_response(response_text)
             logger.error(f"🔤 Prompt response: {response_text}")
 
-            evaluation_dict = json.loads(response_text)
-            evaluation_data = EvaluationData(**evaluation_dict)
+            # Parse and validate in one pass inside pydantic-core.
+            evaluation_data = EvaluationData.model_validate_json(response_text)
 
             return evaluation_data
 
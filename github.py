@@ -1,55 +1,211 @@
 import os
 import re
 import json
+import logging
 import requests
+from requests.adapters import HTTPAdapter
 import datetime
 import time
-from pathlib import Path
-
-from typing import Dict, List, Optional, Any
+import sqlite3
+import threading
+from functools import lru_cache
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+from typing import Dict, List, NamedTuple, Optional, Any
 from models import GitHubProfile
 from pdf import logger
-from prompts.template_manager import TemplateManager
+from prompts.template_manager import get_template_manager
 from prompt import DEFAULT_MODEL, MODEL_PARAMETERS
 from llm_utils import initialize_llm_provider, extract_json_from_response
 from config import DEVELOPMENT_MODE
 
+# One pooled session for every GitHub call so repeated requests to
+# api.github.com reuse the same TCP+TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0)
+)
+_GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+if _GITHUB_TOKEN:
+    _SESSION.headers["Authorization"] = f"token {_GITHUB_TOKEN}"
+
+# Concurrent per-repo contributor requests; kept below the session pool size.
+CONTRIBUTOR_FETCH_WORKERS = 8
+# Contributor lookups are made for at most this many repos per profile.
+MAX_CONTRIBUTOR_FETCHES = 20
+
+# In-process LRU of (status_code, data) keyed by URL + params, so repeated
+# lookups within a run skip the network regardless of DEVELOPMENT_MODE.
+_MEMORY_CACHE_SIZE = 512
+_memory_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+# Development-mode response cache: one SQLite file instead of a JSON file per
+# URL. Shared across the contributor-fetch threads, hence the lock.
+_CACHE_DB_PATH = "cache/gh_cache.sqlite"
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_db_lock = threading.Lock()
+
+# Freshness per endpoint (last URL path segment); anything else is a user
+# profile, which changes least often.
+_CACHE_TTL_SECONDS = {"contributors": 600, "repos": 300}
+_DEFAULT_CACHE_TTL_SECONDS = 3600
+
+# The subset of /users/{user}/repos fields that fetch_all_github_repos reads.
+_REPO_FIELDS = (
+    "name",
+    "description",
+    "html_url",
+    "homepage",
+    "language",
+    "stargazers_count",
+    "forks_count",
+    "fork",
+    "created_at",
+    "updated_at",
+    "topics",
+    "open_issues_count",
+    "size",
+    "archived",
+    "default_branch",
+)
+
+_USERNAME_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        r"https?://github\.com/([^/]+)",
+        r"github\.com/([^/]+)",
+        r"@([^/]+)",
+        r"^([a-zA-Z0-9-]+)$",
+    )
+]
+
 
-def _create_cache_filename(api_url: str, params: dict = None) -> str:
-    url_parts = api_url.replace("https://api.github.com/", "").replace("/", "_")
+def _create_cache_key(api_url: str, params: dict = None, fields=None) -> str:
+    key = api_url.replace("https://api.github.com/", "").replace("/", "_")
 
     if params:
         param_str = "_".join([f"{k}_{v}" for k, v in sorted(params.items())])
-        filename = f"cache/gh_githubcache_{url_parts}_{param_str}.json"
-    else:
-        filename = f"cache/gh_githubcache_{url_parts}.json"
-    return filename
-
-
-def _fetch_github_api(api_url, params=None):
-    headers = {}
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
+        key = f"{key}_{param_str}"
+    if fields:
+        # Projected bodies differ from full ones, so they get their own entry.
+        key = f"{key}__fields_{'_'.join(fields)}"
+    return key
+
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Open (once) the SQLite store backing the development-mode cache."""
+    global _cache_db
+    if _cache_db is None:
+        os.makedirs(os.path.dirname(_CACHE_DB_PATH), exist_ok=True)
+        _cache_db = sqlite3.connect(
+            _CACHE_DB_PATH, isolation_level=None, check_same_thread=False
+        )
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+            "fetched_at INTEGER NOT NULL)"
+        )
+        columns = {row[1] for row in _cache_db.execute("PRAGMA table_info(responses)")}
+        if "etag" not in columns:
+            _cache_db.execute("ALTER TABLE responses ADD COLUMN etag TEXT")
+    return _cache_db
+
+
+def _cache_ttl(api_url: str) -> int:
+    endpoint = api_url.rstrip("/").rsplit("/", 1)[-1]
+    return _CACHE_TTL_SECONDS.get(endpoint, _DEFAULT_CACHE_TTL_SECONDS)
+
+
+def _read_cached_response(cache_key: str, ttl: int) -> Optional[tuple]:
+    """Return ``(data, etag, fresh)`` for a cached entry, or None if absent."""
+    with _cache_db_lock:
+        db = _get_cache_db()
+        row = db.execute(
+            "SELECT body, etag, fetched_at FROM responses WHERE key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None:
+            return None
 
-    cache_filename = _create_cache_filename(api_url, params)
-    if DEVELOPMENT_MODE and os.path.exists(cache_filename):
-        print(f"Loading cached GitHub data from {cache_filename}")
         try:
-            cached_data = json.loads(Path(cache_filename).read_text(encoding="utf-8"))
+            cached_data = json.loads(row[0])
             if not cached_data:
                 raise ValueError("Cached data is empty")
-            return 200, cached_data
         except Exception as e:
-            print(f"⚠️ Warning: Error reading cache file {cache_filename}: {e}")
-            try:
-                os.remove(cache_filename)
-            except Exception as delete_err:
-                print(
-                    f"Failed to delete invalid cache file {cache_filename}: {delete_err}"
-                )
+            logger.warning(f"⚠️ Error reading cache entry {cache_key}: {e}")
+            db.execute("DELETE FROM responses WHERE key = ?", (cache_key,))
+            return None
+
+        # Stale entries are still returned so the caller can revalidate them
+        # with their ETag instead of downloading the body again.
+        return cached_data, row[1], time.time() - row[2] <= ttl
+
+
+def _write_cached_response(cache_key: str, data: Any, etag: Optional[str]) -> None:
+    # Machine-read cache: compact separators, no pretty-printing.
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    with _cache_db_lock:
+        _get_cache_db().execute(
+            "INSERT OR REPLACE INTO responses (key, body, etag, fetched_at) "
+            "VALUES (?, ?, ?, ?)",
+            (cache_key, body, etag, int(time.time())),
+        )
 
-    response = requests.get(api_url, params, timeout=10, headers=headers)
+
+def _touch_cached_response(cache_key: str) -> None:
+    with _cache_db_lock:
+        _get_cache_db().execute(
+            "UPDATE responses SET fetched_at = ? WHERE key = ?",
+            (int(time.time()), cache_key),
+        )
+
+
+def clear_github_cache():
+    """Drop all in-process cached GitHub responses."""
+    with _memory_cache_lock:
+        _memory_cache.clear()
+
+
+def _fetch_github_api(api_url, params=None, fields=None):
+    key = (api_url, tuple(sorted((params or {}).items())), fields)
+    with _memory_cache_lock:
+        cached = _memory_cache.get(key)
+        if cached is not None:
+            _memory_cache.move_to_end(key)
+            return cached
+
+    result = _fetch_github_api_uncached(api_url, params, fields)
+
+    # Only definitive answers are worth remembering; rate-limit and server
+    # errors should be retried on the next call.
+    if result[0] in (200, 404):
+        with _memory_cache_lock:
+            _memory_cache[key] = result
+            if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+                _memory_cache.popitem(last=False)
+    return result
+
+
+def _fetch_github_api_uncached(api_url, params=None, fields=None):
+    cache_key = _create_cache_key(api_url, params, fields)
+    cached = None
+    headers = None
+    if DEVELOPMENT_MODE:
+        cached = _read_cached_response(cache_key, _cache_ttl(api_url))
+        if cached is not None:
+            cached_data, etag, fresh = cached
+            if fresh:
+                logger.debug(f"Loading cached GitHub data for {cache_key}")
+                return 200, cached_data
+            if etag:
+                # Conditional request: a 304 does not count against the
+                # primary rate limit and carries no body.
+                headers = {"If-None-Match": etag}
+
+    response = _SESSION.get(api_url, params=params, headers=headers, timeout=10)
     status_code = response.status_code
 
     # Check GitHub rate limit headers
@@ -76,7 +232,7 @@ def _fetch_github_api(api_url, params=None):
             # Cap maximum wait time at 1 hour
             max_wait = 3600
             if wait_seconds > max_wait:
-                print(
+                logger.warning(
                     f"⚠️  Rate limit reset time is too far in the future ({wait_seconds}s). Capping wait to {max_wait}s"
                 )
                 wait_seconds = max_wait
@@ -84,7 +240,7 @@ def _fetch_github_api(api_url, params=None):
             logger.error(
                 f"⚠️  GitHub API rate limit low: {remaining}/{limit} requests remaining. Resets at {reset_time}"
             )
-            print(
+            logger.info(
                 f"💡 Tip: Set GITHUB_TOKEN environment variable to increase rate limits (60/hour → 5000/hour)"
             )
 
@@ -93,48 +249,52 @@ def _fetch_github_api(api_url, params=None):
                     f"⏳ Proactively sleeping for {wait_seconds} seconds until rate limit resets..."
                 )
                 time.sleep(wait_seconds)
-                print(f"✅ Rate limit should be reset now. Continuing...")
+                logger.info("✅ Rate limit should be reset now. Continuing...")
         elif remaining < 100:
             logger.info(
                 f"ℹ️  GitHub API rate limit: {remaining}/{limit} requests remaining"
             )
 
-    data = response.json() if response.status_code == 200 else {}
+    if status_code == 304 and cached is not None:
+        logger.debug(f"GitHub data unchanged for {cache_key}")
+        _touch_cached_response(cache_key)
+        return 200, cached[0]
+
+    data = {}
+    if status_code == 200:
+        # Decode straight from the body bytes, skipping the intermediate str
+        # that response.json() builds via response.text.
+        data = json.loads(response.content)
+        if fields and isinstance(data, list):
+            # List endpoints carry ~80 keys per item; keep only what callers
+            # read so the in-memory and on-disk caches stay small.
+            data = [
+                {field: item[field] for field in fields if field in item}
+                for item in data
+            ]
 
     if DEVELOPMENT_MODE and status_code == 200:
         try:
-            os.makedirs("cache", exist_ok=True)
-            Path(cache_filename).write_text(
-                json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            _write_cached_response(cache_key, data, response.headers.get("ETag"))
         except Exception as e:
-            logger.error(f"Error caching GitHub data to {cache_filename}: {e}")
+            logger.error(f"Error caching GitHub data for {cache_key}: {e}")
 
     return status_code, data
 
 
+# Called by both the profile and the repo fetch for the same URL.
+@lru_cache(maxsize=256)
 def extract_github_username(github_url: str) -> Optional[str]:
     if not github_url:
         return None
 
-    github_url = github_url.replace(" ", "")
-    github_url = github_url.strip()
-
-    patterns = [
-        r"https?://github\.com/([^/]+)",
-        r"github\.com/([^/]+)",
-        r"@([^/]+)",
-        r"^([a-zA-Z0-9-]+)$",
-    ]
+    github_url = "".join(github_url.split())
 
-    for pattern in patterns:
-        match = re.search(pattern, github_url)
+    for pattern in _USERNAME_PATTERNS:
+        match = pattern.search(github_url)
         if match:
-            username = match.group(1)
             # Remove query parameters if present (e.g., "?tab=repositories")
-            if "?" in username:
-                username = username.split("?", 1)[0]
-            return username
+            return match.group(1).partition("?")[0]
     return None
 
 
@@ -143,7 +303,7 @@ def fetch_github_profile(github_url: str) -> Optional[GitHubProfile]:
         username = extract_github_username(github_url)
         logger.info(f"{username}")
         if not username:
-            print(f"Could not extract username from: {github_url}")
+            logger.error(f"Could not extract username from: {github_url}")
             return None
 
         api_url = f"https://api.github.com/users/{username}"
@@ -170,33 +330,47 @@ def fetch_github_profile(github_url: str) -> Optional[GitHubProfile]:
 
             return profile
         elif status_code == 404:
-            print(f"GitHub user not found: {username}")
+            logger.error(f"GitHub user not found: {username}")
             return None
         else:
-            print(f"GitHub API error: {status_code} - {data}")
+            logger.error(f"GitHub API error: {status_code} - {data}")
             return None
 
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching GitHub profile: {e}")
+        logger.error(f"Error fetching GitHub profile: {e}")
         return None
     except Exception as e:
-        print(f"Unexpected error fetching GitHub profile: {e}")
+        logger.error(f"Unexpected error fetching GitHub profile: {e}")
         return None
 
 
-def fetch_contributions_count(owner: str, contributors_data):
+class ContribStats(NamedTuple):
+    count: Optional[int]
+    user_contrib: Optional[int]
+    total_contrib: Optional[int]
+
+
+def summarize_contributors(owner: str, contributors_data) -> ContribStats:
+    # A successful contributors response is always a list of dicts, so the
+    # shape is checked once rather than per entry.
+    if not isinstance(contributors_data, list):
+        return ContribStats(0, 0, 0)
+
+    owner_login = owner.lower()
+    user_found = False
     user_contributions = 0
     total_contributions = 0
 
     for contributor in contributors_data:
-        if isinstance(contributor, dict):
-            contributions = contributor.get("contributions", 0)
-            total_contributions += contributions
+        contributions = contributor.get("contributions", 0)
+        total_contributions += contributions
 
-            if contributor.get("login", "").lower() == owner.lower():
-                user_contributions = contributions
+        # Logins are unique, so stop lowercasing once the owner is found.
+        if not user_found and contributor.get("login", "").lower() == owner_login:
+            user_contributions = contributions
+            user_found = True
 
-    return user_contributions, total_contributions
+    return ContribStats(len(contributors_data), user_contributions, total_contributions)
 
 
 def fetch_repo_contributors(owner: str, repo_name: str) -> list[dict]:
@@ -219,91 +393,123 @@ def fetch_all_github_repos(github_url: str, max_repos: int = 100) -> List[Dict]:
     try:
         username = extract_github_username(github_url)
         if not username:
-            print(f"Could not extract username from: {github_url}")
+            logger.error(f"Could not extract username from: {github_url}")
             return []
 
         api_url = f"https://api.github.com/users/{username}/repos"
 
         params = {"sort": "updated", "per_page": min(max_repos, 100), "type": "all"}
 
-        status_code, repos_data = _fetch_github_api(api_url, params=params)
+        status_code, repos_data = _fetch_github_api(
+            api_url, params=params, fields=_REPO_FIELDS
+        )
 
         if status_code == 200:
-            projects = []
-            for repo in repos_data:
-                if repo.get("fork") and repo.get("forks_count", 0) < 5:
-                    continue
-
-                repo_name = repo.get("name")
-
-                contributors_data = fetch_repo_contributors(username, repo_name)
-                contributor_count = len(contributors_data)
-
-                user_contributions, total_contributions = fetch_contributions_count(
-                    username, contributors_data
-                )
-
-                project_type = (
-                    "open_source" if contributor_count > 1 else "self_project"
+            repos = [
+                repo
+                for repo in repos_data
+                if not (repo.get("fork") and repo.get("forks_count", 0) < 5)
+            ]
+
+            # Only the most starred/forked repos can realistically make the
+            # final selection, so contributor lookups are limited to those.
+            # The sort is stable, so ties keep the "recently updated" order.
+            repos.sort(
+                key=lambda repo: repo.get("stargazers_count", 0)
+                + repo.get("forks_count", 0),
+                reverse=True,
+            )
+            candidates = repos[:MAX_CONTRIBUTOR_FETCHES]
+
+            # Contributor lookups are independent network round trips, so run
+            # them concurrently over the shared session.
+            with ThreadPoolExecutor(max_workers=CONTRIBUTOR_FETCH_WORKERS) as pool:
+                contributors_per_repo = list(
+                    pool.map(
+                        lambda repo: fetch_repo_contributors(
+                            username, repo.get("name")
+                        ),
+                        candidates,
+                    )
                 )
+            contributors_per_repo += [None] * (len(repos) - len(candidates))
+
+            ranked = []
+            for repo, contributors_data in zip(repos, contributors_per_repo):
+                # Bind the lookup once; each repo reads ~15 fields.
+                g = repo.get
+                repo_name = g("name")
+                stars = g("stargazers_count", 0)
+                forks = g("forks_count", 0)
+                description = g("description")
+                language = g("language")
+                homepage = g("homepage")
+
+                if contributors_data is None:
+                    # Not looked up, so neither the type nor any count is
+                    # known; generate_projects_json leaves such repos out.
+                    stats = ContribStats(None, None, None)
+                    project_type = "unknown"
+                else:
+                    stats = summarize_contributors(username, contributors_data)
+                    project_type = "open_source" if stats.count > 1 else "self_project"
 
                 project = {
-                    "name": repo.get("name"),
-                    "description": repo.get("description"),
-                    "github_url": repo.get("html_url"),
-                    "live_url": repo.get("homepage") if repo.get("homepage") else None,
-                    "technologies": (
-                        [repo.get("language")] if repo.get("language") else []
-                    ),
+                    "name": repo_name,
+                    "description": description,
+                    "github_url": g("html_url"),
+                    "live_url": homepage if homepage else None,
+                    "technologies": [language] if language else [],
                     "project_type": project_type,
-                    "contributor_count": contributor_count,
-                    "author_commit_count": user_contributions,
-                    "total_commit_count": total_contributions,
+                    "contributor_count": stats.count,
+                    "author_commit_count": stats.user_contrib,
+                    "total_commit_count": stats.total_contrib,
                     "github_details": {
-                        "stars": repo.get("stargazers_count", 0),
-                        "forks": repo.get("forks_count", 0),
-                        "language": repo.get("language"),
-                        "description": repo.get("description"),
-                        "created_at": repo.get("created_at"),
-                        "updated_at": repo.get("updated_at"),
-                        "topics": repo.get("topics", []),
-                        "open_issues": repo.get("open_issues_count", 0),
-                        "size": repo.get("size", 0),
-                        "fork": repo.get("fork", False),
-                        "archived": repo.get("archived", False),
-                        "default_branch": repo.get("default_branch"),
-                        "contributors": contributor_count,
+                        "stars": stars,
+                        "forks": forks,
+                        "language": language,
+                        "description": description,
+                        "created_at": g("created_at"),
+                        "updated_at": g("updated_at"),
+                        "topics": g("topics", []),
+                        "open_issues": g("open_issues_count", 0),
+                        "size": g("size", 0),
+                        "fork": g("fork", False),
+                        "archived": g("archived", False),
+                        "default_branch": g("default_branch"),
+                        "contributors": stats.count,
                     },
                 }
-                projects.append(project)
+                ranked.append((stars, project))
 
-            projects.sort(key=lambda x: x["github_details"]["stars"], reverse=True)
+            # Sort on the pre-extracted star count rather than digging into
+            # github_details per comparison; the sort is stable, so ties keep
+            # the API's "recently updated" order.
+            ranked.sort(key=itemgetter(0), reverse=True)
+            projects = [project for _, project in ranked]
 
-            open_source_count = sum(
-                1 for p in projects if p["project_type"] == "open_source"
-            )
-            self_project_count = sum(
-                1 for p in projects if p["project_type"] == "self_project"
-            )
+            type_counts = Counter(p["project_type"] for p in projects)
+            open_source_count = type_counts["open_source"]
+            self_project_count = type_counts["self_project"]
 
-            print(f"✅ Found {len(projects)} repositories")
-            print(
-                f"📊 Project classification: {open_source_count} open source, {self_project_count} self projects"
+            logger.info(f"✅ Found {len(projects)} repositories")
+            logger.info(
+                f"📊 Project classification: {open_source_count} open source, {self_project_count} self projects, {type_counts['unknown']} not checked"
             )
             return projects
 
         elif status_code == 404:
-            print(f"GitHub user not found: {username}")
+            logger.error(f"GitHub user not found: {username}")
             return []
         else:
-            print(f"GitHub API error: {status_code} - {repos_data}")
+            logger.error(f"GitHub API error: {status_code} - {repos_data}")
             return []
 
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching GitHub repositories: {e}")
+        logger.error(f"Error fetching GitHub repositories: {e}")
         return []
     except Exception as e:
-        print(f"Unexpected error fetching GitHub repositories: {e}")
+        logger.error(f"Unexpected error fetching GitHub repositories: {e}")
         return []
 
 
@@ -311,58 +517,50 @@ def generate_profile_json(profile: GitHubProfile) -> Dict:
     if not profile:
         return {}
 
-    profile_data = {
-        "username": profile.username,
-        "name": profile.name,
-        "bio": profile.bio,
-        "location": profile.location,
-        "company": profile.company,
-        "public_repos": profile.public_repos,
-        "followers": profile.followers,
-        "following": profile.following,
-        "created_at": profile.created_at,
-        "updated_at": profile.updated_at,
-        "avatar_url": profile.avatar_url,
-        "blog": profile.blog,
-        "twitter_username": profile.twitter_username,
-        "hireable": profile.hireable,
+    return profile.model_dump()
+
+
+def _compact_project_for_selection(project: Dict) -> Dict:
+    details = project.get("github_details", {})
+    return {
+        "name": project.get("name"),
+        "description": (project.get("description") or "")[:200],
+        "live_url": project.get("live_url"),
+        "project_type": project.get("project_type"),
+        "author_commit_count": project.get("author_commit_count"),
+        "total_commit_count": project.get("total_commit_count"),
+        "language": details.get("language"),
+        "stars": details.get("stars", 0),
+        "forks": details.get("forks", 0),
+        "fork": details.get("fork", False),
+        "topics": details.get("topics", [])[:5],
+        "updated_at": details.get("updated_at"),
     }
 
-    return profile_data
-
 
 def generate_projects_json(projects: List[Dict]) -> List[Dict]:
     if not projects:
         return []
 
     try:
-        projects_data = []
-        for project in projects:
-            if project.get("author_commit_count") == 0:
-                continue
-
-            project_data = {
-                "name": project.get("name"),
-                "description": project.get("description"),
-                "github_url": project.get("github_url"),
-                "live_url": project.get("live_url"),
-                "technologies": project.get("technologies", []),
-                "project_type": project.get("project_type", "self_project"),
-                "contributor_count": project.get("contributor_count", 1),
-                "author_commit_count": project.get("author_commit_count", 0),
-                "total_commit_count": project.get("total_commit_count", 0),
-                "github_details": project.get("github_details", {}),
-            }
-            projects_data.append(project_data)
-
-        projects_json = json.dumps(projects_data, indent=2)
+        # fetch_all_github_repos already emits exactly the keys the selection
+        # prompt needs, so pass the dicts through rather than rebuilding them.
+        # Repos with zero or unknown (not fetched) commit counts are skipped.
+        projects_data = [
+            project for project in projects if project.get("author_commit_count")
+        ]
+
+        # The prompt only needs the ranking signals; the full records are
+        # looked up again by name once the LLM has chosen.
+        projects_json = json.dumps(
+            [_compact_project_for_selection(project) for project in projects_data]
+        )
 
-        template_manager = TemplateManager()
-        prompt = template_manager.render_template(
+        prompt = get_template_manager().render_template(
             "github_project_selection", projects_data=projects_json
         )
 
-        print(
+        logger.info(
             f"🤖 Using LLM to select top 5 projects from {len(projects)} repositories..."
         )
 
@@ -398,49 +596,62 @@ def generate_projects_json(projects: List[Dict]) -> List[Dict]:
 
             selected_projects = json.loads(response_text)
 
+            projects_by_name = {
+                project["name"]: project
+                for project in projects_data
+                if project.get("name")
+            }
             unique_projects = []
             seen_names = set()
 
-            for project in selected_projects:
-                project_name = project.get("name", "")
-                if project_name and project_name not in seen_names:
+            for selection in selected_projects:
+                project_name = selection.get("name", "")
+                if project_name in projects_by_name and project_name not in seen_names:
+                    project = dict(projects_by_name[project_name])
+                    reason = selection.get("reason_for_project_selection")
+                    if reason:
+                        project["reason_for_project_selection"] = reason
                     unique_projects.append(project)
                     seen_names.add(project_name)
 
             if len(unique_projects) < 7:
-                print(
+                logger.warning(
                     f"⚠️ LLM selected {len(selected_projects)} projects but {len(unique_projects)} are unique"
                 )
 
-                for project in projects_data:
-                    if len(unique_projects) >= 7:
-                        break
-                    project_name = project.get("name", "")
-                    if project_name and project_name not in seen_names:
-                        unique_projects.append(project)
-                        seen_names.add(project_name)
-
-            project_names = ", ".join(
-                [proj.get("name", "N/A") for proj in unique_projects]
-            )
-            print(
-                f"✅ LLM selected {len(unique_projects)} unique top projects: {project_names}"
-            )
+                remaining = [
+                    project
+                    for project in projects_data
+                    if project.get("name") and project["name"] not in seen_names
+                ]
+                padding = remaining[: 7 - len(unique_projects)]
+                unique_projects.extend(padding)
+                seen_names.update(project["name"] for project in padding)
+
+            # Joining the names is only worth doing if the line is emitted.
+            if logger.isEnabledFor(logging.INFO):
+                project_names = ", ".join(
+                    proj.get("name", "N/A") for proj in unique_projects
+                )
+                logger.info(
+                    f"✅ LLM selected {len(unique_projects)} unique top projects: {project_names}"
+                )
             return unique_projects
 
         except json.JSONDecodeError as e:
-            print(f"ERROR: Error parsing LLM response: {e}")
-            print(f"ERROR: Raw response: {response_text}")
+            logger.error(f"Error parsing LLM response: {e}")
+            logger.error(f"Raw response: {response_text}")
 
-            print("🔄 Falling back to first 7 projects")
+            logger.info("🔄 Falling back to first 7 projects")
             return projects_data[:7]
 
     except Exception as e:
-        print(f"Error using LLM for project selection: {e}")
-        print("🔄 Falling back to first 7 projects")
+        logger.error(f"Error using LLM for project selection: {e}")
+        logger.info("🔄 Falling back to first 7 projects")
 
+        checked = [p for p in projects if p.get("project_type") != "unknown"]
         projects_data = []
-        for project in projects[:7]:
+        for project in checked[:7]:
             project_data = {
                 "name": project.get("name"),
                 "description": project.get("description"),
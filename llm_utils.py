@@ -2,13 +2,27 @@
 Utility functions for LLM providers.
 """
 
+import json
 import logging
+import re
+import threading
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from config import provider_for
 from models import OpenAICompatibleProvider
 
 logger = logging.getLogger(__name__)
 
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+# Anchored to the whole response (no MULTILINE): only an opening fence at the
+# very start and a closing fence at the very end are removed.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# One provider (and so one pooled HTTP session) per distinct endpoint config,
+# shared by every model that resolves to it.
+_PROVIDERS: Dict[tuple, OpenAICompatibleProvider] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
 
 def extract_json_from_response(response_text: str) -> str:
     """
@@ -23,30 +37,38 @@ def extract_json_from_response(response_text: str) -> str:
 
     response_text = response_text.strip()
     if "<think>" in response_text:
-        think_start = response_text.find("<think>")
-        think_end = response_text.find("</think>")
-        if think_start != -1 and think_end != -1:
-            response_text = response_text[:think_start] + response_text[think_end + 8 :]
+        response_text = _THINK_RE.sub("", response_text).strip()
 
-    # Remove leading ```json if present
-    if response_text.startswith("```json"):
-        response_text = response_text[7:]
-    # Remove trailing ``` if present
-    if response_text.endswith("```"):
-        response_text = response_text[:-3]
-    return response_text
+    return _FENCE_RE.sub("", response_text)
 
 
+@lru_cache(maxsize=8)
 def initialize_llm_provider(model_name: str) -> Any:
     """
     Initialize an OpenAI-compatible LLM provider for the given model,
     resolving base_url / api_key / structured-output mode from providers.json.
+
+    Cached per model name, so config resolution and the "Using model" log
+    happen once per model. Providers hold no per-request state, so models
+    that resolve to the same endpoint configuration share one instance.
     """
     cfg = provider_for(model_name)
     logger.info(f"🔄 Using model {model_name} via {cfg['base_url']}")
-    return OpenAICompatibleProvider(
-        base_url=cfg["base_url"],
-        api_key=cfg["api_key"],
-        structured_output=cfg["structured_output"],
-        extra_body=cfg["extra_body"],
+    key = (
+        cfg["base_url"],
+        cfg["api_key"],
+        cfg["structured_output"],
+        json.dumps(cfg["extra_body"], sort_keys=True),
+        cfg["max_concurrency"],
     )
+    with _PROVIDERS_LOCK:
+        provider = _PROVIDERS.get(key)
+        if provider is None:
+            provider = _PROVIDERS[key] = OpenAICompatibleProvider(
+                base_url=cfg["base_url"],
+                api_key=cfg["api_key"],
+                structured_output=cfg["structured_output"],
+                extra_body=cfg["extra_body"],
+                max_concurrency=cfg["max_concurrency"],
+            )
+    return provider
@@ -1,8 +1,18 @@
-from typing import List, Optional, Dict, Tuple, Any, Protocol, runtime_checkable
-from pydantic import BaseModel, Field, field_validator
+import json
+import logging
+import random
+import threading
+import time
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Dict, Any, Protocol
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
 
 
-@runtime_checkable
 class LLMProvider(Protocol):
     """Protocol for LLM providers."""
 
@@ -190,6 +200,21 @@ class AwardsSection(BaseModel):
     awards: Optional[List[Award]] = None
 
 
+class ResumeSections(BaseModel):
+    """All extracted sections, returned together by a single LLM call.
+
+    basics and work are required so that a reply missing them is rejected
+    and extraction falls back to per-section calls.
+    """
+
+    basics: Basics
+    work: List[Work]
+    education: Optional[List[Education]] = None
+    skills: Optional[List[Skill]] = None
+    projects: Optional[List[Project]] = None
+    awards: Optional[List[Award]] = None
+
+
 class JSONResume(BaseModel):
     """Complete JSON Resume format model."""
 
@@ -237,8 +262,8 @@ class EvaluationData(BaseModel):
     scores: Scores
     bonus_points: BonusPoints
     deductions: Deductions
-    key_strengths: List[str] = Field(min_items=1, max_items=5)
-    areas_for_improvement: List[str] = Field(min_items=1, max_items=5)
+    key_strengths: List[str] = Field(min_length=1, max_length=5)
+    areas_for_improvement: List[str] = Field(min_length=1, max_length=5)
 
 
 class GitHubProfile(BaseModel):
@@ -260,6 +285,24 @@ class GitHubProfile(BaseModel):
     hireable: Optional[bool] = None
 
 
+# Options forwarded to the chat-completions body; anything else is ignored.
+_SAMPLING_OPTIONS = frozenset({"temperature", "top_p"})
+
+
+@lru_cache(maxsize=8)
+def _shared_session(base_url: str, pool_maxsize: int) -> requests.Session:
+    """Return the pooled session for an endpoint, shared by all its providers.
+
+    Credentials are sent per request, so providers with different API keys or
+    extra_body settings can safely share one connection pool.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class OpenAICompatibleProvider:
     """Generic OpenAI-chat-compatible LLM provider.
 
@@ -268,17 +311,98 @@ class OpenAICompatibleProvider:
     response to the {"message": {"content": ...}} shape the evaluator expects.
     """
 
+    # Circuit breaker: after this many consecutive calls fail on connection
+    # errors or 5xx responses, fail fast for BREAKER_COOLDOWN seconds instead
+    # of sitting through the full retry schedule again.
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLDOWN = 60.0
+
+    # Connection errors get their own short schedule, separate from the 429
+    # budget: a stopped local server should fail in seconds, not minutes.
+    CONNECT_RETRIES = 4
+    CONNECT_BASE_DELAY = 0.5
+    CONNECT_MAX_DELAY = 8.0
+
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "structured_output",
+        "extra_body",
+        "_url",
+        "_headers",
+        "_session",
+        "_slots",
+        "_failures",
+        "_open_until",
+        "_breaker_lock",
+    )
+
     def __init__(
         self,
         base_url: str,
         api_key: Optional[str] = None,
         structured_output: str = "json_schema",
         extra_body: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 4,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.structured_output = structured_output
         self.extra_body = extra_body or {}
+        # Fixed per provider; built once rather than on every chat call.
+        self._url = f"{self.base_url}/chat/completions"
+        self._headers = {"Content-Type": "application/json"}
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+
+        # Keep-alive: reuse the TCP/TLS connection across chat calls.
+        self._session = _shared_session(self.base_url, max_concurrency)
+        # Caps in-flight requests across every thread sharing this provider,
+        # so parallel callers queue here instead of tripping rate limits.
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._failures = 0
+        self._open_until = 0.0
+        # Section extraction calls chat() from several threads at once.
+        self._breaker_lock = threading.Lock()
+
+    def _record_failure(self) -> None:
+        with self._breaker_lock:
+            self._failures += 1
+            if self._failures >= self.BREAKER_THRESHOLD:
+                self._open_until = time.monotonic() + self.BREAKER_COOLDOWN
+
+    def _record_success(self) -> None:
+        with self._breaker_lock:
+            self._failures = 0
+
+    def _post(self, url: str, body: Dict[str, Any]) -> requests.Response:
+        for attempt in range(self.CONNECT_RETRIES):
+            try:
+                with self._slots:
+                    return self._session.post(
+                        url, json=body, headers=self._headers, timeout=300
+                    )
+            except requests.exceptions.ConnectionError as e:
+                # Refused/reset connections and connect timeouts fail fast, so
+                # they are cheap to retry. Read timeouts are not: the server may
+                # still be generating, and a retry would repeat that work.
+                if attempt == self.CONNECT_RETRIES - 1:
+                    raise
+                sleep_time = round(
+                    random.uniform(
+                        0,
+                        min(
+                            self.CONNECT_BASE_DELAY * (2**attempt),
+                            self.CONNECT_MAX_DELAY,
+                        ),
+                    ),
+                    2,
+                )
+                logger.warning(
+                    f"[OpenAICompatibleProvider] Connection error: {e} "
+                    f"(attempt {attempt + 1}/{self.CONNECT_RETRIES}). Retrying in {sleep_time}s..."
+                )
+                time.sleep(sleep_time)
 
     def chat(
         self,
@@ -287,16 +411,11 @@ class OpenAICompatibleProvider:
         options: Dict[str, Any] = None,
         **kwargs
     ) -> Dict[str, Any]:
-        import requests
-        import time
-        import random
-
-        options = options or {}
         body: Dict[str, Any] = {"model": model, "messages": messages, "stream": False}
-        if "temperature" in options:
-            body["temperature"] = options["temperature"]
-        if "top_p" in options:
-            body["top_p"] = options["top_p"]
+        if options:
+            body.update(
+                (key, options[key]) for key in _SAMPLING_OPTIONS & options.keys()
+            )
 
         # Structured-output translation: evaluator passes format=<json schema>.
         if "format" in kwargs and self.structured_output != "none":
@@ -311,49 +430,68 @@ class OpenAICompatibleProvider:
 
         body.update(self.extra_body)
 
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        url = self._url
 
-        url = f"{self.base_url}/chat/completions"
+        with self._breaker_lock:
+            failures = self._failures
+            remaining_open = self._open_until - time.monotonic()
+        if remaining_open > 0:
+            raise requests.exceptions.ConnectionError(
+                f"{url} failed {failures} calls in a row; "
+                f"not retrying for another {remaining_open:.0f}s"
+            )
 
         MAX_RETRIES = 5
         BASE_DELAY = 10.0  # seconds — base for exponential backoff
         MAX_DELAY = 120.0  # cap so we never wait more than 2 minutes
+        MAX_TOTAL_DELAY = 300.0  # overall sleep budget across all retries
         # Transient server errors worth retrying with backoff. Unlike 429 these
         # rarely carry a Retry-After header, so we always use exponential backoff.
         RETRYABLE_SERVER_ERRORS = {500, 502, 503, 504}
-        for attempt in range(MAX_RETRIES):
-            response = requests.post(url, json=body, headers=headers, timeout=300)
+        total_waited = 0.0
 
-            if response.status_code == 429 and attempt < MAX_RETRIES - 1:
-                retry_after = response.headers.get("Retry-After")
-                exp_delay = min(BASE_DELAY * (2 ** attempt), MAX_DELAY)
-                delay = float(retry_after) if retry_after else exp_delay
-                sleep_time = round(delay * random.uniform(0.8, 1.2), 2)
-                print(
-                    f"[OpenAICompatibleProvider] Rate limit hit "
-                    f"(attempt {attempt + 1}/{MAX_RETRIES}). Retrying in {sleep_time}s..."
-                )
-                time.sleep(sleep_time)
-                continue
+        def backoff(attempt: int) -> float:
+            # Full jitter: spread concurrent retries across the whole window
+            # instead of having them wake up in lockstep.
+            return round(
+                random.uniform(0, min(BASE_DELAY * (2**attempt), MAX_DELAY)), 2
+            )
 
-            if (
-                response.status_code in RETRYABLE_SERVER_ERRORS
-                and attempt < MAX_RETRIES - 1
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = self._post(url, body)
+            except requests.exceptions.ConnectionError:
+                self._record_failure()
+                raise
+
+            if attempt < MAX_RETRIES - 1 and (
+                response.status_code == 429
+                or response.status_code in RETRYABLE_SERVER_ERRORS
             ):
-                exp_delay = min(BASE_DELAY * (2 ** attempt), MAX_DELAY)
-                sleep_time = round(exp_delay * random.uniform(0.8, 1.2), 2)
-                print(
-                    f"[OpenAICompatibleProvider] Transient server error "
-                    f"{response.status_code} (attempt {attempt + 1}/{MAX_RETRIES}). "
-                    f"Retrying in {sleep_time}s..."
-                )
-                time.sleep(sleep_time)
-                continue
-
+                sleep_time = backoff(attempt)
+                retry_after = response.headers.get("Retry-After")
+                if response.status_code == 429 and retry_after:
+                    sleep_time = float(retry_after)
+
+                if total_waited + sleep_time <= MAX_TOTAL_DELAY:
+                    if response.status_code == 429:
+                        reason = "Rate limit hit"
+                    else:
+                        reason = f"Transient server error {response.status_code}"
+                    logger.warning(
+                        f"[OpenAICompatibleProvider] {reason} "
+                        f"(attempt {attempt + 1}/{MAX_RETRIES}). Retrying in {sleep_time}s..."
+                    )
+                    time.sleep(sleep_time)
+                    total_waited += sleep_time
+                    continue
+
+            if response.status_code in RETRYABLE_SERVER_ERRORS:
+                self._record_failure()
             response.raise_for_status()
-            data = response.json()
+            self._record_success()
+            # Decode from the raw bytes; skips requests' text/charset detection.
+            data = json.loads(response.content)
             try:
                 content = data["choices"][0]["message"]["content"]
             except (KeyError, IndexError, TypeError):
@@ -4,6 +4,9 @@ import json
 import time
 import logging
 import pymupdf
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pydantic import ValidationError
 
 from models import (
     JSONResume,
@@ -19,6 +22,7 @@ from models import (
     SkillsSection,
     ProjectsSection,
     AwardsSection,
+    ResumeSections,
 )
 from llm_utils import initialize_llm_provider, extract_json_from_response
 from pymupdf_rag import to_markdown
@@ -27,15 +31,28 @@ from prompt import (
     DEFAULT_MODEL,
     MODEL_PARAMETERS,
 )
-from prompts.template_manager import TemplateManager
+from prompts.template_manager import get_template_manager
 from transform import transform_parsed_data
+from config import SINGLE_CALL_EXTRACTION
 
 logger = logging.getLogger(__name__)
 
+# The opt-in single call requests these sections together as "full_resume".
+_COMBINED_SECTIONS = ("basics", "work", "education", "skills", "projects", "awards")
+
+
+@lru_cache(maxsize=None)
+def _schema_for(model) -> Dict[str, Any]:
+    # A model's structured-output schema never changes; build it once rather
+    # than walking the model graph on every LLM call.
+    return model.model_json_schema()
+
 
 class PDFHandler:
     def __init__(self):
-        self.template_manager = TemplateManager()
+        self.template_manager = get_template_manager()
+        # Section system messages depend only on the section name.
+        self._system_messages: Dict[str, str] = {}
         self._initialize_llm_provider()
 
     def _initialize_llm_provider(self):
@@ -61,11 +78,22 @@ class PDFHandler:
             logger.error(f"An error occurred while reading the PDF: {e}")
             return None
 
-    def _call_llm_for_section(
-        self, section_name: str, text_content: str, prompt: str, return_model=None
-    ) -> Optional[Dict]:
+    def _system_message(self, section_name: str) -> Optional[str]:
+        message = self._system_messages.get(section_name)
+        if message is None:
+            if section_name == "full_resume":
+                params = {"section_names_param": _COMBINED_SECTIONS}
+            else:
+                params = {"section_name_param": section_name}
+            message = self.template_manager.render_template("system_message", **params)
+            if message:
+                self._system_messages[section_name] = message
+        return message
+
+    def _request_section_json(
+        self, section_name: str, prompt: str, return_model=None
+    ) -> Optional[Any]:
         try:
-            start_time = time.time()
             logger.debug(
                 f"🔄 Extracting {section_name} section using {DEFAULT_MODEL}..."
             )
@@ -74,9 +102,7 @@ class PDFHandler:
                 DEFAULT_MODEL, {"temperature": 0.1, "top_p": 0.9}
             )
 
-            section_system_message = self.template_manager.render_template(
-                "system_message", section_name_param=section_name
-            )
+            section_system_message = self._system_message(section_name)
             if not section_system_message:
                 logger.error(
                     f"❌ Failed to render system message template for {section_name}"
@@ -98,7 +124,7 @@ class PDFHandler:
 
             kwargs = {}
             if return_model:
-                kwargs["format"] = return_model.model_json_schema()
+                kwargs["format"] = _schema_for(return_model)
 
             # Use the appropriate provider to make the API call
             response = self.provider.chat(**chat_params, **kwargs)
@@ -107,21 +133,15 @@ class PDFHandler:
 
             try:
                 response_text = extract_json_from_response(response_text)
-                json_start = response_text.find("{")
-                json_end = response_text.rfind("}")
-                if json_start != -1 and json_end != -1:
-                    response_text = response_text[json_start : json_end + 1]
-                parsed_data = json.loads(response_text)
-                logger.debug(f"✅ Successfully extracted {section_name} section")
-
-                transformed_data = transform_parsed_data(parsed_data)
-                end_time = time.time()
-                total_time = end_time - start_time
-                logger.debug(
-                    f"⏱️ Total time for separate section extraction: {total_time:.2f} seconds"
-                )
-
-                return transformed_data
+                try:
+                    return json.loads(response_text)
+                except json.JSONDecodeError:
+                    # Only scan for braces when the model wrapped the JSON in prose.
+                    json_start = response_text.find("{")
+                    json_end = response_text.rfind("}")
+                    if json_start == -1 or json_end == -1:
+                        raise
+                    return json.loads(response_text[json_start : json_end + 1])
             except json.JSONDecodeError as e:
                 logger.error(f"❌ Error parsing JSON for {section_name} section: {e}")
                 logger.error(f"Raw response: {response_text}")
@@ -131,6 +151,29 @@ class PDFHandler:
             logger.error(f"❌ Error calling LLM for {section_name} section: {e}")
             return None
 
+    def _call_llm_for_section(
+        self, section_name: str, text_content: str, prompt: str, return_model=None
+    ) -> Optional[Dict]:
+        start_time = time.time()
+        parsed_data = self._request_section_json(section_name, prompt, return_model)
+        if parsed_data is None:
+            return None
+
+        try:
+            logger.debug(f"✅ Successfully extracted {section_name} section")
+
+            transformed_data = transform_parsed_data(parsed_data)
+            end_time = time.time()
+            total_time = end_time - start_time
+            logger.debug(
+                f"⏱️ Total time for separate section extraction: {total_time:.2f} seconds"
+            )
+
+            return transformed_data
+        except Exception as e:
+            logger.error(f"❌ Error calling LLM for {section_name} section: {e}")
+            return None
+
     def extract_basics_section(self, resume_text: str) -> Optional[Dict]:
         prompt = self.template_manager.render_template(
             "basics", text_content=resume_text
@@ -189,7 +232,7 @@ class PDFHandler:
 
     def extract_json_from_text(self, resume_text: str) -> Optional[JSONResume]:
         try:
-            return self._extract_all_sections_separately(resume_text)
+            return self._extract_resume(resume_text)
         except Exception as e:
             logger.error(f"Error calling Ollama: {e}")
             return None
@@ -208,7 +251,7 @@ class PDFHandler:
             )
 
             logger.debug("🔄 Extracting all sections separately...")
-            return self._extract_all_sections_separately(text_content)
+            return self._extract_resume(text_content)
 
         except Exception as e:
             logger.error(f"❌ Error during PDF to JSON extraction: {e}")
@@ -261,6 +304,15 @@ class PDFHandler:
 
         return None
 
+    def _extract_section_with_retry(
+        self, text_content: str, section_name: str
+    ) -> Optional[Dict]:
+        section_data = self._extract_section_data(text_content, section_name)
+        if section_data is None:
+            logger.warning(f"🔁 Retrying {section_name} section extraction")
+            section_data = self._extract_section_data(text_content, section_name)
+        return section_data
+
     def _extract_all_sections_separately(
         self, text_content: str
     ) -> Optional[JSONResume]:
@@ -284,43 +336,112 @@ class PDFHandler:
             "meta": None,
         }
 
-        for section_name in sections:
-            section_data = self._extract_section_data(text_content, section_name)
-            if section_data is None:
-                logger.warning(f"🔁 Retrying {section_name} section extraction")
-                section_data = self._extract_section_data(text_content, section_name)
-
-            if section_data:
-                complete_resume.update(section_data)
-                logger.debug(f"✅ Successfully extracted {section_name} section")
-            elif section_data is not None:
-                # Valid response with no content for this section (e.g. no awards)
-                logger.warning(f"⚠️ {section_name} section empty; continuing")
-            else:
-                logger.error(
-                    f"⚠️ Failed to extract {section_name} section. Aborting extraction to prevent partial/invalid resume data."
-                )
-                return None
+        # The section calls are independent and I/O-bound, so issue them
+        # together; the provider's own concurrency limit still applies. Each
+        # worker retries its own section, so one slow retry holds up no other.
+        executor = ThreadPoolExecutor(max_workers=len(sections))
+        try:
+            futures = {
+                executor.submit(
+                    self._extract_section_with_retry, text_content, section_name
+                ): section_name
+                for section_name in sections
+            }
+            for future in as_completed(futures):
+                section_name = futures[future]
+                section_data = future.result()
+
+                # Sections fill disjoint keys, so merge order does not matter.
+                if section_data:
+                    complete_resume.update(section_data)
+                    logger.debug(f"✅ Successfully extracted {section_name} section")
+                elif section_data is not None:
+                    # Valid response with no content for this section (e.g. no awards)
+                    logger.warning(f"⚠️ {section_name} section empty; continuing")
+                else:
+                    logger.error(
+                        f"⚠️ Failed to extract {section_name} section. Aborting extraction to prevent partial/invalid resume data."
+                    )
+                    return None
+        finally:
+            # On abort, drop sections not yet started rather than waiting.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        json_resume = self._build_json_resume(complete_resume)
+        if json_resume is not None:
+            end_time = time.time()
+            total_time = end_time - start_time
+            logger.info(
+                f"⏱️ Total time for separate section extraction: {total_time:.2f} seconds"
+            )
+        return json_resume
+
+    def _extract_all_sections_single_call(
+        self, text_content: str
+    ) -> Optional[JSONResume]:
+        start_time = time.time()
+
+        prompt = self.template_manager.render_template(
+            "full_resume", text_content=text_content
+        )
+        if not prompt:
+            logger.error("❌ Failed to render full_resume template")
+            return None
+
+        parsed_data = self._request_section_json("full_resume", prompt, ResumeSections)
+        if parsed_data is None:
+            return None
+
+        # The per-section path tolerates sloppy replies because transform
+        # fills the gaps; here a bad reply should fall back instead.
+        try:
+            ResumeSections.model_validate(parsed_data)
+        except ValidationError as e:
+            logger.error(f"❌ full_resume response failed validation: {e}")
+            return None
+
+        section_data = transform_parsed_data(parsed_data)
+        if not section_data:
+            return None
+
+        json_resume = self._build_json_resume(dict(section_data))
+        if json_resume is not None:
+            end_time = time.time()
+            total_time = end_time - start_time
+            logger.info(
+                f"⏱️ Total time for single-call extraction: {total_time:.2f} seconds"
+            )
+        return json_resume
+
+    def _extract_resume(self, text_content: str) -> Optional[JSONResume]:
+        # Image-only PDFs yield whitespace; don't spend LLM calls on them.
+        if not text_content or not text_content.strip():
+            logger.error("❌ No resume text to extract sections from")
+            return None
 
+        if SINGLE_CALL_EXTRACTION:
+            json_resume = self._extract_all_sections_single_call(text_content)
+            if json_resume is not None:
+                return json_resume
+            logger.warning(
+                "🔁 Single-call extraction failed; falling back to per-section calls"
+            )
+        return self._extract_all_sections_separately(text_content)
+
+    def _build_json_resume(self, complete_resume: Dict) -> Optional[JSONResume]:
         try:
             if complete_resume.get("basics") and isinstance(
                 complete_resume["basics"], dict
             ):
                 try:
-                    complete_resume["basics"] = Basics(**complete_resume["basics"])
+                    complete_resume["basics"] = Basics.model_validate(
+                        complete_resume["basics"]
+                    )
                 except Exception as e:
                     logger.error(f"❌ Error creating Basics object: {e}")
                     complete_resume["basics"] = None
 
-            json_resume = JSONResume(**complete_resume)
-
-            end_time = time.time()
-            total_time = end_time - start_time
-            logger.info(
-                f"⏱️ Total time for separate section extraction: {total_time:.2f} seconds"
-            )
-
-            return json_resume
+            return JSONResume.model_validate(complete_resume)
 
         except Exception as e:
             logger.error(f"❌ Error creating JSONResume object: {e}")
@@ -6,6 +6,7 @@ section-specific resume extraction prompts.
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 from jinja2 import Environment, FileSystemLoader, Template
 
@@ -41,6 +42,7 @@ class TemplateManager:
             "skills": "skills.jinja",
             "projects": "projects.jinja",
             "awards": "awards.jinja",
+            "full_resume": "full_resume.jinja",
             "system_message": "system_message.jinja",
             "github_project_selection": "github_project_selection.jinja",
             "resume_evaluation_criteria": "resume_evaluation_criteria.jinja",
@@ -88,3 +90,13 @@ class TemplateManager:
         except Exception as e:
             print(f"❌ Error rendering template for {section_name}: {e}")
             return None
+
+
+@lru_cache(maxsize=None)
+def get_template_manager(template_dir: str = "prompts/templates") -> TemplateManager:
+    """
+    Return a shared TemplateManager for the given directory.
+
+    Templates are loaded once per process instead of once per handler.
+    """
+    return TemplateManager(template_dir)
@@ -14,6 +14,7 @@ os.environ["PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"] = "python"
 
 import logging
 import csv
+import hashlib
 
 if sys.platform == "win32":
     if hasattr(sys.stdout, "reconfigure"):
@@ -229,11 +230,18 @@ def find_profile(profiles, network):
     )
 
 
+def pdf_digest(pdf_path: str) -> str:
+    """Short content hash of a PDF, so edited files miss the resume cache."""
+    return hashlib.blake2b(Path(pdf_path).read_bytes(), digest_size=8).hexdigest()
+
+
 def main(pdf_path):
-    # Create cache filename based on PDF path
-    cache_filename = (
-        f"cache/resumecache_{os.path.basename(pdf_path).replace('.pdf', '')}.json"
-    )
+    # Create cache filename based on PDF name and contents; hashing the PDF
+    # is only worth it when the cache is in use.
+    cache_filename = None
+    if DEVELOPMENT_MODE and os.path.exists(pdf_path):
+        pdf_stem = os.path.basename(pdf_path).replace(".pdf", "")
+        cache_filename = f"cache/resumecache_{pdf_stem}_{pdf_digest(pdf_path)}.json"
     github_cache_filename = (
         f"cache/githubcache_{os.path.basename(pdf_path).replace('.pdf', '')}.json"
     )
@@ -242,11 +250,12 @@ def main(pdf_path):
     cache_loaded = False
 
     # Check if cache exists and we're in development mode
-    if DEVELOPMENT_MODE and os.path.exists(cache_filename):
+    if cache_filename and os.path.exists(cache_filename):
         print(f"Loading cached data from {cache_filename}")
         try:
-            cached_data = json.loads(Path(cache_filename).read_text(encoding="utf-8"))
-            loaded_resume = JSONResume(**cached_data)
+            loaded_resume = JSONResume.model_validate_json(
+                Path(cache_filename).read_bytes()
+            )
             if not is_valid_resume_data(loaded_resume):
                 raise ValueError("Cached resume data contains no core content")
             resume_data = loaded_resume
@@ -264,7 +273,7 @@ def main(pdf_path):
     if not cache_loaded:
         logger.debug(
             f"Extracting data from PDF"
-            + (" and caching to " + cache_filename if DEVELOPMENT_MODE else "")
+            + (" and caching to " + cache_filename if cache_filename else "")
         )
         pdf_handler = PDFHandler()
         resume_data = pdf_handler.extract_json_from_pdf(pdf_path)
@@ -272,13 +281,14 @@ def main(pdf_path):
         if resume_data == None:
             return None
 
-        if DEVELOPMENT_MODE:
+        if cache_filename:
             if is_valid_resume_data(resume_data):
                 os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
-                Path(cache_filename).write_text(
-                    json.dumps(resume_data.model_dump(), indent=2, ensure_ascii=False),
-                    encoding="utf-8",
+                tmp_filename = cache_filename + ".tmp"
+                Path(tmp_filename).write_text(
+                    resume_data.model_dump_json(indent=2), encoding="utf-8"
                 )
+                os.replace(tmp_filename, cache_filename)
             else:
                 logger.warning(
                     "Newly extracted resume data is empty/invalid. Skipping cache write."
@@ -290,9 +300,7 @@ def main(pdf_path):
     if DEVELOPMENT_MODE and os.path.exists(github_cache_filename):
         print(f"Loading cached data from {github_cache_filename}")
         try:
-            loaded_github = json.loads(
-                Path(github_cache_filename).read_text(encoding="utf-8")
-            )
+            loaded_github = json.loads(Path(github_cache_filename).read_bytes())
             if (
                 not isinstance(loaded_github, dict)
                 or not loaded_github
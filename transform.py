@@ -485,9 +485,12 @@ def parse_date_range(date_range: str) -> tuple:
 
 def fetch_profile(profiles, network_names, prefix):
     """Helper function to extract profile information for a given network."""
+    # Lowercase each profile's network once instead of once per candidate name.
+    profile_networks = [(p.network.lower(), p) for p in profiles if p.network]
     for network in network_names:
+        network = network.lower()
         profile = next(
-            (p for p in profiles if p.network and p.network.lower() == network.lower()),
+            (p for name, p in profile_networks if name == network),
             None,
         )
         if profile: